@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 
 def visualize_polyhedron(A_mat: np.array, b_mat: np.array):
@@ -13,16 +14,24 @@ def visualize_polyhedron(A_mat: np.array, b_mat: np.array):
     """
     plt.figure(figsize=(10, 5))
 
-    x0 = np.linspace(-10, 10, 100).reshape(-1, 1)
+    A_mat = np.asarray(A_mat, dtype=float)
+    b_mat = np.asarray(b_mat, dtype=float).reshape(-1)
 
-    consts = []
+    # Rows with A_i = 0 do not define a line
+    rows = np.any(A_mat != 0, axis=1)
+    A_mat, b_mat = A_mat[rows], b_mat[rows]
 
-    for i in range(A_mat.squeeze().shape[0]):
+    # Every constraint line is drawn as one segment between x0 = -10 and x0 = 10,
+    # vertical lines (A_i1 = 0) between x1 = -10 and x1 = 10 instead
+    x0 = np.array([-10.0, 10.0])
+    vert = A_mat[:, 1] == 0
+    segments = np.empty(shape=(A_mat.shape[0], 2, 2))
+    segments[~vert, :, 0] = x0
+    segments[~vert, :, 1] = (b_mat[~vert, None] - A_mat[~vert, 0, None]*x0)/A_mat[~vert, 1, None]
+    segments[vert, :, 0] = (b_mat[vert]/A_mat[vert, 0])[:, None]
+    segments[vert, :, 1] = x0
 
-        x1 = (b_mat[i] - A_mat[i,0]*x0)/A_mat[i,1]
-        x1 = x1.reshape(-1, 1)
-        consts.append(x1)
-        plt.plot(x0, x1, color='blue')
+    plt.gca().add_collection(LineCollection(segments, colors='blue'))
 
     plt.xlim((0, 10))
     plt.ylim((0, 10))